@@ -15,10 +15,7 @@ def attach_injector(
     Call this function on app startup to attach an injector to the app.
     """
     app.state.injector = injector
-    injector.binder.bind(
-        RequestScopeOptions, InstanceProvider(options), scope=singleton
-    )
-    injector.binder.bind(RequestScopeFactory, to=RequestScopeFactory, scope=singleton)
+    _bind_request_scope(injector, options)
 
 
 def get_injector_instance(app: FastAPI) -> Injector:
@@ -42,10 +39,7 @@ def attach_injector_taskiq(
     Call this function on taskiq startup to attach an injector to the taskiq.
     """
     state.injector = injector
-    injector.binder.bind(
-        RequestScopeOptions, InstanceProvider(options), scope=singleton
-    )
-    injector.binder.bind(RequestScopeFactory, to=RequestScopeFactory, scope=singleton)
+    _bind_request_scope(injector, options)
 
 
 def get_injector_instance_taskiq(state: TaskiqState) -> Injector:
@@ -58,3 +52,10 @@ def get_injector_instance_taskiq(state: TaskiqState) -> Injector:
         raise InjectorNotAttached(
             "No injector instance has been attached to the app."
         ) from exc
+
+
+def _bind_request_scope(injector: Injector, options: RequestScopeOptions) -> None:
+    injector.binder.bind(
+        RequestScopeOptions, InstanceProvider(options), scope=singleton
+    )
+    injector.binder.bind(RequestScopeFactory, to=RequestScopeFactory, scope=singleton)
@@ -1,6 +1,5 @@
 import asyncio
 import threading
-import uuid
 from contextlib import (
     AbstractAsyncContextManager,
     AbstractContextManager,
@@ -11,14 +10,53 @@ from contextvars import ContextVar
 from dataclasses import dataclass
 from typing import Any, Dict, Optional, Type
 
-from injector import Inject, Injector, InstanceProvider, Provider
+from injector import Injector, InstanceProvider, Provider
 from injector import Scope as InjectorScope
 from injector import ScopeDecorator, T
 from starlette.types import Receive, Scope, Send
 
 from fastapi_injector.exceptions import RequestScopeError
 
-_request_id_ctx: ContextVar[uuid.UUID] = ContextVar("request_id")
+
+class _RequestState:
+    """
+    Holds the dependencies cached for a single request and their cleanup stack.
+    Dependencies are kept per scope instance, so injectors that each have their own
+    RequestScope (e.g. parent and child injectors) never share cached instances.
+    """
+
+    __slots__ = ("deps", "stack", "closed")
+
+    def __init__(self) -> None:
+        self.deps: Dict[InjectorScope, Dict[Type, Provider]] = {}
+        self.stack: Optional[AsyncExitStack] = None
+        self.closed = False
+
+    def deps_for(self, scope: InjectorScope) -> Dict[Type, Provider]:
+        """Returns the dependencies cached for the given scope instance."""
+        try:
+            return self.deps[scope]
+        except KeyError:
+            deps: Dict[Type, Provider] = {}
+            self.deps[scope] = deps
+            return deps
+
+
+_request_state_ctx: ContextVar[_RequestState] = ContextVar("request_state")
+
+
+def _get_request_state() -> _RequestState:
+    try:
+        state = _request_state_ctx.get()
+    except LookupError as exc:
+        raise RequestScopeError(
+            "Request state missing. "
+            "Make sure InjectorMiddleware has been added to the FastAPI instance."
+        ) from exc
+    if state.closed:
+        # Tasks and contexts copied during the request still see its state
+        raise RequestScopeError("The request scope has already been exited.")
+    return state
 
 
 @dataclass
@@ -58,52 +96,48 @@ class RequestScope(InjectorScope):
         attach_injector(app, inj)
     """
 
-    cache: Dict[uuid.UUID, Dict[Type, Any]]
-
     def __init__(self, injector: Injector) -> None:
         super().__init__(injector)
         self.options = injector.get(RequestScopeOptions)
-        self.cache = {}
-        self._loop = asyncio.new_event_loop()
-        self._thr = threading.Thread(
-            target=self._loop.run_forever,
-            name="fastapi-injector-enter-context",
-            daemon=True,
-        )
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
+        self._thread_loops = threading.local()
+        if type(self).get is RequestScope.get:
+            # Most apps never enable cleanup, so pick the lookup variant once instead
+            # of checking on every resolve. Subclasses overriding get are left alone
+            self.get = (  # type: ignore[method-assign]
+                self._get_with_cleanup
+                if self.options.enable_cleanup
+                else self._get_without_cleanup
+            )
 
     def get(self, key: Type[T], provider: Provider[T]) -> Provider[T]:
-        try:
-            request_id = _request_id_ctx.get()
-        except LookupError as exc:
-            raise RequestScopeError(
-                "Request ID missing in cache. "
-                "Make sure InjectorMiddleware has been added to the FastAPI instance."
-            ) from exc
-        stack: Optional[AsyncExitStack] = None
         if self.options.enable_cleanup:
-            if AsyncExitStack in self.cache[request_id]:
-                stack = self.cache[request_id][AsyncExitStack]
-            else:
-                stack = self.cache[request_id][AsyncExitStack] = AsyncExitStack()
-        if key in self.cache[request_id]:
-            dependency = self.cache[request_id][key]
-        else:
-            dependency = provider.get(self.injector)
-            self.cache[request_id][key] = dependency
-            if stack:
-                self._register(dependency, stack)
-        return InstanceProvider(dependency)
-
-    def add_key(self, key: uuid.UUID) -> None:
-        """Add a new request key to the cache."""
-        self.cache[key] = {}
-
-    async def clear_key(self, key: uuid.UUID) -> None:
-        """Clear the cache for a given request key."""
-        stack: AsyncExitStack = self.cache[key].get(AsyncExitStack, None)
-        if stack:
-            await stack.aclose()
-        del self.cache[key]
+            return self._get_with_cleanup(key, provider)
+        return self._get_without_cleanup(key, provider)
+
+    def _get_with_cleanup(self, key: Type[T], provider: Provider[T]) -> Provider[T]:
+        state = _get_request_state()
+        deps = state.deps_for(self)
+        try:
+            return deps[key]
+        except KeyError:
+            pass
+        dependency = provider.get(self.injector)
+        instance_provider = deps[key] = InstanceProvider(dependency)
+        if state.stack is None:
+            state.stack = AsyncExitStack()
+        self._register(dependency, state.stack)
+        return instance_provider
+
+    def _get_without_cleanup(self, key: Type[T], provider: Provider[T]) -> Provider[T]:
+        deps = _get_request_state().deps_for(self)
+        try:
+            return deps[key]
+        except KeyError:
+            pass
+        instance_provider = deps[key] = InstanceProvider(provider.get(self.injector))
+        return instance_provider
 
     def _register(self, obj: Any, stack: AsyncExitStack):
         if isinstance(obj, AbstractContextManager):
@@ -120,8 +154,10 @@ class RequestScope(InjectorScope):
         try:
             asyncio.get_running_loop()
         except RuntimeError:  # 'RuntimeError: There is no current event loop...'
-            # Starting new event loop
-            asyncio.run(stack.enter_async_context(obj))
+            # No loop is running on this thread (e.g. a sync route in the threadpool),
+            # so enter the context right here. Injector.get holds a re-entrant lock,
+            # which __aenter__ can only take again from this same thread
+            self._get_thread_loop().run_until_complete(stack.enter_async_context(obj))
         else:
             # Event loop is running, enter the context on a background thread
             self._run_async(stack.enter_async_context(obj))
@@ -129,11 +165,34 @@ class RequestScope(InjectorScope):
     def _run_async(self, coroutine):
         # This will block the calling thread until the coroutine is finished.
         # Any exception that occurs in the coroutine is raised in the caller
-        if not self._thr.is_alive():
-            self._thr.start()
-        future = asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+        future = asyncio.run_coroutine_threadsafe(coroutine, self._get_loop())
         return future.result()
 
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        # The background loop and its thread are only needed once an async context
+        # manager is entered, so they are created on first use
+        if self._loop is None:
+            with self._loop_lock:
+                if self._loop is None:
+                    loop = asyncio.new_event_loop()
+                    threading.Thread(
+                        target=loop.run_forever,
+                        name="fastapi-injector-enter-context",
+                        daemon=True,
+                    ).start()
+                    self._loop = loop
+        return self._loop
+
+    def _get_thread_loop(self) -> asyncio.AbstractEventLoop:
+        # One loop per calling thread, kept open so that contexts entered on it can
+        # still use it when they are exited at the end of the request
+        loop: Optional[asyncio.AbstractEventLoop] = getattr(
+            self._thread_loops, "loop", None
+        )
+        if loop is None:
+            loop = self._thread_loops.loop = asyncio.new_event_loop()
+        return loop
+
 
 request_scope = ScopeDecorator(RequestScope)
 
@@ -143,20 +202,18 @@ class RequestScopeFactory:
     Allows to create request scopes.
     """
 
-    def __init__(self, request_scope_instance: Inject[RequestScope]) -> None:
-        self.request_scope_instance = request_scope_instance
-
     @asynccontextmanager
     async def create_scope(self):
         """Creates a new request scope within dependencies are cached."""
-        rid = uuid.uuid4()
-        rid_ctx = _request_id_ctx.set(rid)
-        self.request_scope_instance.add_key(rid)
+        state = _RequestState()
+        token = _request_state_ctx.set(state)
         try:
             yield
         finally:
-            await self.request_scope_instance.clear_key(rid)
-            _request_id_ctx.reset(rid_ctx)
+            state.closed = True
+            if state.stack:
+                await state.stack.aclose()
+            _request_state_ctx.reset(token)
 
 
 class InjectorMiddleware:
@@ -170,8 +227,8 @@ class InjectorMiddleware:
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
-        Add an identifier to the request
-        that can be used retrieve scoped dependencies.
+        Set a fresh per-request state in the ContextVar
+        that request-scoped dependencies are cached in.
         """
         async with self.request_scope_factory.create_scope():
             await self.app(scope, receive, send)
@@ -1,13 +1,17 @@
 import abc
 import asyncio
+import contextvars
+import gc
+import threading
 import time
 import uuid
+import weakref
 from typing import Tuple
 
 import httpx
 import pytest
 from fastapi import FastAPI
-from injector import Injector, InstanceProvider, inject, singleton
+from injector import Injector, InstanceProvider, ScopeDecorator, inject, singleton
 from starlette import status
 
 from fastapi_injector import (
@@ -197,20 +201,29 @@ async def test_request_scope_cache_cleared(app_inj):
     app, inj = app_inj
     inj.binder.bind(DummyInterface, to=DummyImpl, scope=request_scope)
 
+    instances = []
+
     @app.get("/")
     def get_root(
         dummy: DummyInterface = Injected(DummyInterface),
         dummy2: DummyInterface = Injected(DummyInterface),
     ):
         assert dummy is dummy2
+        instances.append(weakref.ref(dummy))
         return {"dummy": str(dummy)}
 
-    scope_instance = inj.get(RequestScope)
-    assert len(scope_instance.cache) == 0
+    with pytest.raises(RequestScopeError):
+        inj.get(DummyInterface)
     async with httpx.AsyncClient(app=app, base_url="http://test") as client:
         await client.get("/")
+        gc.collect()
+        assert instances[0]() is None
+        await client.get("/")
+        gc.collect()
+        assert instances[1]() is None
 
-    assert len(scope_instance.cache) == 0
+    with pytest.raises(RequestScopeError):
+        inj.get(DummyInterface)
 
 
 async def test_caches_instances_with_scope_factory():
@@ -235,6 +248,75 @@ async def test_caches_instances_with_scope_factory():
         assert dummy1 is not dummy3
 
 
+async def test_child_injector_does_not_share_request_scope_cache():
+    class DummyInterface:
+        pass
+
+    class DummyImpl(DummyInterface):
+        pass
+
+    inj = Injector()
+    inj.binder.bind(DummyInterface, to=DummyInterface, scope=request_scope)
+    child = inj.create_child_injector()
+    child.binder.bind(DummyInterface, to=DummyImpl, scope=request_scope)
+
+    factory = inj.get(RequestScopeFactory)
+
+    async with factory.create_scope():
+        parent_dummy = inj.get(DummyInterface)
+        child_dummy = child.get(DummyInterface)
+        assert type(parent_dummy) is DummyInterface
+        assert type(child_dummy) is DummyImpl
+        assert child.get(DummyInterface) is child_dummy
+
+
+async def test_request_scope_subclass_get_is_used():
+    class DummyInterface:
+        pass
+
+    resolved = []
+
+    class RecordingRequestScope(RequestScope):
+        def get(self, key, provider):
+            resolved.append(key)
+            return super().get(key, provider)
+
+    inj = Injector()
+    inj.binder.bind(
+        DummyInterface, to=DummyInterface, scope=ScopeDecorator(RecordingRequestScope)
+    )
+
+    factory = inj.get(RequestScopeFactory)
+
+    async with factory.create_scope():
+        dummy1 = inj.get(DummyInterface)
+        dummy2 = inj.get(DummyInterface)
+        assert dummy1 is dummy2
+
+    assert resolved == [DummyInterface, DummyInterface]
+
+
+async def test_resolving_after_scope_exit_from_copied_context_fails():
+    inj = Injector()
+    inj.binder.bind(DummyContextManager, to=DummyContextManager, scope=request_scope)
+    options = RequestScopeOptions(enable_cleanup=True)
+    inj.binder.bind(RequestScopeOptions, InstanceProvider(options), scope=singleton)
+
+    factory = inj.get(RequestScopeFactory)
+    scope_exited = asyncio.Event()
+
+    async def resolve_later():
+        await scope_exited.wait()
+        return inj.get(DummyContextManager)
+
+    async with factory.create_scope():
+        task = asyncio.create_task(resolve_later())
+    scope_exited.set()
+
+    with pytest.raises(RequestScopeError):
+        await task
+
+
 async def test_works_without_auto_bind():
     class DummyInterface:
         pass
@@ -292,6 +374,19 @@ class DummyAsyncContextManager:
         self.state = self.EXITED
 
 
+class LoopBoundAsyncContextManager:
+    def __init__(self) -> None:
+        self.loop = None
+        self.loop_closed_on_exit = None
+
+    async def __aenter__(self):
+        self.loop = asyncio.get_running_loop()
+        return self
+
+    async def __aexit__(self, *_args) -> None:
+        self.loop_closed_on_exit = self.loop.is_closed()
+
+
 async def test_context_manager_instances_are_cleaned_up_when_enabled():
     inj = Injector()
     inj.binder.bind(DummyContextManager, to=DummyContextManager, scope=request_scope)
@@ -337,6 +432,64 @@ async def test_async_context_manager_instances_are_cleaned_up_when_enabled():
     assert dummy.state is DummyAsyncContextManager.EXITED
 
 
+async def test_async_context_manager_loop_stays_open_when_resolved_from_thread():
+    inj = Injector()
+    inj.binder.bind(
+        LoopBoundAsyncContextManager,
+        to=LoopBoundAsyncContextManager,
+        scope=request_scope,
+    )
+    options = RequestScopeOptions(enable_cleanup=True)
+    inj.binder.bind(RequestScopeOptions, InstanceProvider(options), scope=singleton)
+
+    factory = inj.get(RequestScopeFactory)
+
+    async with factory.create_scope():
+        dummy = await asyncio.to_thread(inj.get, LoopBoundAsyncContextManager)
+        assert dummy.loop is not None
+
+    assert dummy.loop_closed_on_exit is False
+
+
+async def test_async_context_manager_can_resolve_dependencies_from_thread():
+    class Plain:
+        pass
+
+    inj = Injector()
+
+    class ResolvingAsyncContextManager:
+        async def __aenter__(self):
+            self.plain = inj.get(Plain)
+            return self
+
+        async def __aexit__(self, *_args) -> None:
+            pass
+
+    inj.binder.bind(Plain, to=Plain, scope=request_scope)
+    inj.binder.bind(
+        ResolvingAsyncContextManager,
+        to=ResolvingAsyncContextManager,
+        scope=request_scope,
+    )
+    options = RequestScopeOptions(enable_cleanup=True)
+    inj.binder.bind(RequestScopeOptions, InstanceProvider(options), scope=singleton)
+
+    factory = inj.get(RequestScopeFactory)
+
+    async with factory.create_scope():
+        resolved = []
+        # A daemon thread, so that a deadlock fails the test instead of hanging it
+        thread = threading.Thread(
+            target=contextvars.copy_context().run,
+            args=(lambda: resolved.append(inj.get(ResolvingAsyncContextManager)),),
+            daemon=True,
+        )
+        thread.start()
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+        assert resolved[0].plain is inj.get(Plain)
+
+
 async def test_async_context_manager_instances_are_not_cleaned_up_when_not_enabled():
     inj = Injector()
     inj.binder.bind(